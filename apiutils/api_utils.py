@@ -36,11 +36,16 @@ def fail_gracefully(func):
     return wrapper
 
 
+def log_request(logger: logging.Logger, request: LocalProxy):
+    """ Log the HTTP method and path of an incoming request."""
+    logger.info('Received %s request at %s', request.method, request.path)
+
+
 def parse_authorization_details(auth_header_data):
     pg_host = os.getenv('PG_HOST', '127.0.0.1')
     pg_database = os.getenv('PG_DATABASE', 'test_database')
 
-    return {'user_role': auth_header_data.username, 'password': auth_header_data.password,
+    return {'user': auth_header_data.username, 'password': auth_header_data.password,
             'host': pg_host, 'database': pg_database}
 
 
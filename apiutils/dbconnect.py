@@ -53,7 +53,7 @@ class BaseDBConnect:
     timeout = attr.ib(default=60)  # type: int
     connection = attr.ib(init=False)  # type: psycopg2
 
-    def _attrs_post_init__(self):
+    def __attrs_post_init__(self):
         object.__setattr__(self, 'connection', self._get_connection())
         if self.autocommit:
             self.connection.autocommit = True
@@ -74,11 +74,7 @@ class BaseDBConnect:
         self.logger.info(f'Connecting to {self.database} at host {self.host} as user {self.user}')
 
         try:
-            connection = psycopg2.connect(user=self.user,
-                                          password=self.password,
-                                          host=self.host,
-                                          database=self.database,
-                                          connect_timeout=self.timeout)
+            connection = self._connect()
         except Exception as exc:
             # TODO: catch authorization errors and provide custom error handling
             error_msg = f'Error when connecting to database {self.database} at host {self.host} as user {self.user}.  Exception: {exc}'
@@ -87,6 +83,13 @@ class BaseDBConnect:
         self.logger.info('Successfully connected')
         return connection
 
+    def _connect(self):
+        return psycopg2.connect(user=self.user,
+                                password=self.password,
+                                host=self.host,
+                                database=self.database,
+                                connect_timeout=self.timeout)
+
     def query(self, sql: str, params: tuple=None, commit: bool=True, fetch: bool=False) -> Union[List[dict], None]:
         """ Execute an arbitrary SQL query with provided parameters using.
 
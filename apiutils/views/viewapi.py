@@ -25,8 +25,6 @@ from apiutils import api_utils
 from apiutils.dbconnect import BaseDBConnect
 from apiutils.views.viewpresenter import ViewPresenter, UnexepctedQueryArgs
 
-ENDPOINT_CONFIG = json.load('config.json')
-
 
 class BaseViewApi(Resource):
     """ Provides base functionality for performing queries on database views. The main responsibilities of this class are
@@ -38,10 +36,14 @@ class BaseViewApi(Resource):
 
         Attributes:
               logger - logging.Logger instance to log information / errors to console, files, and / or CloudWatch.
+              connection_type - BaseDBConnect (or subclass) used to open a connection to the database for each request.
     """
 
     logger = logging.getLogger('BaseViewApi')
 
+    # Can be overridden when BaseViewApi is subclassed to provide a custom database connection
+    connection_type = BaseDBConnect
+
     @api_utils.fail_gracefully
     def get(self):
         """ Return view information to requester, filterable by user-provided URL query string arguments.
@@ -54,9 +56,10 @@ class BaseViewApi(Resource):
         """
 
         try:
-            matching_args, request_view = self.get_view_config('apiutils/config.json')
+            endpoint_config = self.get_view_config()['endpoint']
+            matching_args, request_view = endpoint_config['matching_args'], endpoint_config['view']
             pg_connection_data = api_utils.parse_authorization_details(request.authorization)
-            connection = BaseDBConnect(**pg_connection_data)
+            connection = self.connection_type(**pg_connection_data)
             view_data = ViewPresenter.view_contents(connection, matching_args, request_view, request.args)
         except Exception as exc:
             return self.handle_view_exceptions(exc)
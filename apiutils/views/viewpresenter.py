@@ -24,7 +24,7 @@ class ViewPresenter:
         sql = cls.generate_sql_string(base_query, match_string)
 
         # Perform query
-        results = connection.query(sql, params, fetch=True, result_type='listdicts')
+        results = connection.query(sql, params, fetch=True)
         return results
 
     @staticmethod
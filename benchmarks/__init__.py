@@ -0,0 +1,17 @@
+"""
+
+Project: ApiToolbox
+
+File Name: __init__
+
+Author: agent, agent@local
+
+Creation Date: 10/19/26
+
+Version: 1.0
+
+Purpose: Offline load-test and benchmark suite for BaseApi and BaseViewApi.  Run with `python -m benchmarks.run`.
+
+Special Notes: Not installed with the apiutils package.
+
+"""
@@ -0,0 +1,80 @@
+"""
+
+Project: ApiToolbox
+
+File Name: app
+
+Author: agent, agent@local
+
+Creation Date: 10/19/26
+
+Version: 1.0
+
+Purpose: Flask app exposing BaseApi and BaseViewApi subclasses for the load generator to drive.
+
+Special Notes:
+
+"""
+
+from typing import List
+
+from flask import Flask
+from flask_restful import Api
+from marshmallow import Schema, fields
+
+from apiutils.api_utils import parse_authorization_details, parse_post_data
+from apiutils.baseapi import BaseApi
+from apiutils.dbconnect import BaseDBConnect
+from apiutils.views.viewapi import BaseViewApi
+from benchmarks import dataset
+
+
+class BenchUserSchema(Schema):
+    user_id = fields.Int(required=True)
+    user_name = fields.Str(required=True)
+    registration_status = fields.Str(required=True)
+    access_level = fields.Int(required=True)
+    access_id = fields.Int(required=True)
+    created_at = fields.DateTime(required=True)
+
+
+class BenchUsersSchema(Schema):
+    users = fields.Nested(BenchUserSchema, many=True, required=True)
+
+
+class BenchApi(BaseApi):
+    """ GET returns every row of the view named by the `size` query arg; POST parses a list of users and echoes a count."""
+
+    connection_type = BaseDBConnect
+
+    def perform_get_request(self, raw_request, *args, **kwargs) -> dict:
+        view = dataset.view_name(int(raw_request.args['size']))
+        connection = self.connection_type(**parse_authorization_details(raw_request.authorization))
+        return {'users': connection.query(f'SELECT * FROM {view};', fetch=True)}
+
+    def perform_post_request(self, raw_request) -> dict:
+        users = parse_post_data(BenchUsersSchema, raw_request)['users']
+        return {'received': len(users)}
+
+
+def view_api_for_size(size: int, connection_type: type(BaseDBConnect)) -> type(BaseViewApi):
+    """ Create a BaseViewApi subclass serving the benchmark view holding `size` rows."""
+    config = {'endpoint': {'url': f'/view/{size}',
+                           'matching_args': dataset.MATCHING_ARGS,
+                           'view': dataset.view_name(size)}}
+
+    return type(f'BenchViewApi{size}', (BaseViewApi,), {'connection_type': connection_type,
+                                                        'get_view_config': classmethod(lambda cls, config_path='': config)})
+
+
+def create_app(connection_type: type(BaseDBConnect), sizes: List[int]) -> Flask:
+    app = Flask('apiutils-benchmarks')
+    api = Api(app)
+
+    bench_api = type('BenchApi', (BenchApi,), {'connection_type': connection_type})
+    api.add_resource(bench_api, '/users')
+    for size in sizes:
+        view_api = view_api_for_size(size, connection_type)
+        api.add_resource(view_api, view_api.get_view_config()['endpoint']['url'], endpoint=f'view_{size}')
+
+    return app
@@ -0,0 +1,103 @@
+"""
+
+Project: ApiToolbox
+
+File Name: baselines
+
+Author: agent, agent@local
+
+Creation Date: 10/19/26
+
+Version: 1.0
+
+Purpose: Save benchmark results as a baseline and compare later runs against it to flag regressions.
+
+Special Notes: Baselines are only meaningful on the machine they were recorded on, so none are committed; record one
+               locally with --save-baseline.  The recorded platform is printed alongside any comparison made on a
+               different machine.
+
+"""
+
+import json
+import math
+import os
+import platform
+from typing import List
+
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), 'baselines')
+
+# Metric name -> True if a larger value is better
+METRICS = {'requests_per_second': True,
+           'p50_us': False,
+           'p99_us': False,
+           'peak_rss_kb': False}
+
+# Run settings which change what a scenario measures; results recorded with different values are not comparable
+COMPARABLE_SETTINGS = ('backend', 'threads', 'requests', 'cloudwatch')
+
+# Below this many latency samples p99 is little more than the slowest one, so it is not regression-checked
+MIN_P99_SAMPLES = 100
+
+def default_path(backend: str) -> str:
+    return os.path.join(BASELINE_DIR, f'{backend}.json')
+
+
+def machine() -> dict:
+    return {'platform': platform.platform(),
+            'python': platform.python_version(),
+            'processor': platform.processor() or platform.machine(),
+            'cpu_count': os.cpu_count()}
+
+
+def save(results: List[dict], path: str, settings: dict):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as baseline:
+        json.dump({'machine': machine(), 'settings': settings, 'results': results}, baseline, indent=2)
+        baseline.write('\n')
+
+
+def load(path: str) -> dict:
+    with open(path, 'r') as baseline:
+        return json.load(baseline)
+
+
+def settings_mismatches(baseline: dict, settings: dict) -> List[str]:
+    """ Describe every COMPARABLE_SETTINGS value which differs between the baseline and the current run."""
+    recorded = baseline.get('settings', {})
+    return [f'{name}: baseline {recorded.get(name)!r}, this run {settings.get(name)!r}'
+            for name in COMPARABLE_SETTINGS if recorded.get(name) != settings.get(name)]
+
+
+def compare(results: List[dict], baseline: dict, tolerance: float, p99_tolerance: float=None,
+            min_p99_samples: int=MIN_P99_SAMPLES) -> List[str]:
+    """ Return a description of every metric which is more than `tolerance` (a fraction) worse than the baseline.
+        p99 latency is only checked for scenarios with at least `min_p99_samples` latency samples (micro stages time a
+        batch of calls per sample), against `p99_tolerance` (defaults to `tolerance`).  Scenarios missing from the baseline are ignored.
+    """
+    if p99_tolerance is None:
+        p99_tolerance = tolerance
+
+    baseline_results = {result['key']: result for result in baseline['results']}
+    regressions = []
+    for result in results:
+        previous = baseline_results.get(result['key'])
+        if previous is None:
+            continue
+        if result['errors'] > previous['errors']:
+            regressions.append(f"{result['key']}: errors {previous['errors']} -> {result['errors']}")
+        for metric, higher_is_better in METRICS.items():
+            allowed = tolerance
+            if metric == 'p99_us':
+                if min(result['samples'], previous.get('samples', 0)) < min_p99_samples:
+                    continue
+                allowed = p99_tolerance
+            old, new = previous.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            if old == 0:
+                change = 0.0 if new == 0 else math.copysign(math.inf, new)
+            else:
+                change = (new - old) / old
+            if (higher_is_better and change < -allowed) or (not higher_is_better and change > allowed):
+                regressions.append(f'{result["key"]}: {metric} {old} -> {new} ({change:+.1%})')
+    return regressions
@@ -0,0 +1,44 @@
+"""
+
+Project: ApiToolbox
+
+File Name: dataset
+
+Author: agent, agent@local
+
+Creation Date: 10/19/26
+
+Version: 1.0
+
+Purpose: Shape of the rows served by the benchmark views, shared by the fake and Postgres backends.
+
+Special Notes:
+
+"""
+
+import datetime
+from typing import List, Tuple
+
+DEFAULT_SIZES = (1, 1000, 100000)
+
+COLUMNS = ('user_id', 'user_name', 'registration_status', 'access_level', 'access_id', 'created_at')
+
+MATCHING_ARGS = ['user_id', 'user_name', 'registration_status', 'access_level', 'access_id']
+
+# Every row is 'registered' so filtering on it exercises the WHERE clause generation without shrinking the result set
+REGISTRATION_STATUS = 'registered'
+
+CREATED_AT = datetime.datetime(2019, 8, 12, 9, 30)
+
+
+def view_name(size: int) -> str:
+    return f'v_bench_users_{size}'
+
+
+def size_from_view(view: str) -> int:
+    return int(view.rsplit('_', 1)[-1])
+
+
+def make_rows(size: int) -> List[Tuple]:
+    """ Build `size` rows of column values in COLUMNS order."""
+    return [(i, f'user_{i}', REGISTRATION_STATUS, i % 5, 1000 + i, CREATED_AT) for i in range(1, size + 1)]
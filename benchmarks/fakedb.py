@@ -0,0 +1,103 @@
+"""
+
+Project: ApiToolbox
+
+File Name: fakedb
+
+Author: agent, agent@local
+
+Creation Date: 10/19/26
+
+Version: 1.0
+
+Purpose: In-process stand-in for a psycopg2 connection so the CPU-bound parts of the request pipeline can be measured
+         without a database.
+
+Special Notes: Rows are real psycopg2.extras.DictRow objects so BaseDBConnect.query pays the same dict conversion
+               cost it would against Postgres.
+
+"""
+
+from collections import OrderedDict
+import re
+from typing import Dict, List
+
+import psycopg2.extras
+
+from apiutils.dbconnect import BaseDBConnect
+from benchmarks import dataset
+
+VIEW_PATTERN = re.compile(r'FROM\s+(\w+)', re.IGNORECASE)
+
+
+class FakeCursor:
+
+    description = tuple((name,) for name in dataset.COLUMNS)
+    index = OrderedDict((name, i) for i, name in enumerate(dataset.COLUMNS))
+
+    def __init__(self, rowsets: Dict[str, List[psycopg2.extras.DictRow]]):
+        self.rowsets = rowsets
+        self._rows = None
+
+    def execute(self, sql: str, params: tuple=None):
+        match = VIEW_PATTERN.search(sql)
+        if not match or match.group(1) not in self.rowsets:
+            raise psycopg2.ProgrammingError(f'relation referenced by "{sql}" does not exist')
+        self._rows = self.rowsets[match.group(1)]
+
+    def fetchall(self) -> List[psycopg2.extras.DictRow]:
+        if self._rows is None:
+            raise psycopg2.ProgrammingError('no results to fetch')
+        return self._rows
+
+    def close(self):
+        self._rows = None
+
+
+class FakeConnection:
+
+    autocommit = False
+
+    def __init__(self, rowsets: Dict[str, List[psycopg2.extras.DictRow]]):
+        self.rowsets = rowsets
+
+    def cursor(self, cursor_factory=None) -> FakeCursor:
+        return FakeCursor(self.rowsets)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def build_rowsets(sizes: List[int]) -> Dict[str, List[psycopg2.extras.DictRow]]:
+    """ Pre-build the DictRows served for each benchmark view so row construction is not part of any measurement."""
+    rowsets = {}
+    for size in sizes:
+        rows = []
+        for values in dataset.make_rows(size):
+            row = psycopg2.extras.DictRow(FakeCursor)
+            row[:] = values
+            rows.append(row)
+        rowsets[dataset.view_name(size)] = rows
+    return rowsets
+
+
+class FakeDBConnect(BaseDBConnect):
+    """ BaseDBConnect which hands out a FakeConnection instead of connecting to Postgres.  Only the connect call is
+        replaced, so the connection logging in BaseDBConnect._get_connection still runs.  Call
+        FakeDBConnect.load(sizes) before use.
+    """
+
+    rowsets = {}
+
+    @classmethod
+    def load(cls, sizes: List[int]):
+        cls.rowsets = build_rowsets(sizes)
+
+    def _connect(self) -> FakeConnection:
+        return FakeConnection(self.rowsets)
@@ -0,0 +1,135 @@
+"""
+
+Project: ApiToolbox
+
+File Name: loadgen
+
+Author: agent, agent@local
+
+Creation Date: 10/19/26
+
+Version: 1.0
+
+Purpose: Multi-threaded load generator driving a Flask app through its test client.
+
+Special Notes: Each worker thread owns its own test client.  Latencies are measured around the full client call, so
+               they include Werkzeug's request/response handling as well as the apiutils pipeline.  Request bodies are
+               encoded once up front so building them is not measured.
+
+"""
+
+import base64
+import math
+import sys
+import threading
+import time
+from typing import Callable
+
+import attr
+from flask import Flask
+
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
+
+
+@attr.s(slots=True, frozen=True)
+class RequestSpec:
+    method = attr.ib()  # type: str
+    path = attr.ib()  # type: str
+    query_string = attr.ib(default=None)  # type: dict
+    data = attr.ib(default=None)  # type: bytes
+    headers = attr.ib(default=None)  # type: dict
+
+
+@attr.s(slots=True, frozen=True)
+class LoadResult:
+    """ Timings of the successful requests of a run.  `errors` counts the requests left out of them."""
+    requests = attr.ib()  # type: int
+    errors = attr.ib()  # type: int
+    elapsed = attr.ib()  # type: float
+    latencies = attr.ib(repr=False)  # type: List[float]
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """ Nearest-rank percentile of request latency, in seconds."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+
+def basic_auth_header(user: str, password: str) -> dict:
+    token = base64.b64encode(f'{user}:{password}'.encode()).decode()
+    return {'Authorization': f'Basic {token}'}
+
+
+def peak_rss_kb() -> int:
+    """ Peak resident set size of this process in KiB, or 0 where it cannot be determined."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and KiB everywhere else
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _send(client, spec: RequestSpec):
+    return client.open(spec.path, method=spec.method, query_string=spec.query_string, data=spec.data,
+                       headers=spec.headers)
+
+
+def run_load(app: Flask, spec: RequestSpec, requests: int, threads: int=1, warmup: int=1,
+             expected_status: int=200, on_error: Callable[[object], None]=None) -> LoadResult:
+    """ Send `requests` copies of `spec` to `app` from `threads` worker threads and time each one.
+
+        `warmup` requests are sent first on the calling thread and excluded from the results.  Responses without
+        `expected_status` are counted as errors and left out of the request count, throughput and latencies.
+    """
+    warmup_client = app.test_client()
+    for _ in range(warmup):
+        _send(warmup_client, spec)
+
+    counter = iter(range(requests))
+    counter_lock = threading.Lock()
+    latencies = []
+    errors = []
+    start_barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        client = app.test_client()
+        thread_latencies = []
+        thread_errors = 0
+        start_barrier.wait()
+        while True:
+            with counter_lock:
+                if next(counter, None) is None:
+                    break
+            sent = time.perf_counter()
+            response = _send(client, spec)
+            latency = time.perf_counter() - sent
+            if response.status_code == expected_status:
+                thread_latencies.append(latency)
+            else:
+                thread_errors += 1
+                if on_error is not None:
+                    on_error(response)
+        # list.extend / append are atomic under the GIL
+        latencies.extend(thread_latencies)
+        errors.append(thread_errors)
+
+    workers = [threading.Thread(target=worker, daemon=True) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    start_barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return LoadResult(requests=len(latencies), errors=sum(errors), elapsed=elapsed, latencies=latencies)
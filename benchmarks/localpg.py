@@ -0,0 +1,138 @@
+"""
+
+Project: ApiToolbox
+
+File Name: localpg
+
+Author: agent, agent@local
+
+Creation Date: 10/19/26
+
+Version: 1.0
+
+Purpose: Throwaway local Postgres for benchmarking the request pipeline against a real database.
+
+Special Notes: If PG_HOST is set the server it points at is used (PG_DATABASE, BENCH_PG_USER and BENCH_PG_PASSWORD
+               supply the rest) and only the benchmark tables/views are created and dropped.  Otherwise a temporary
+               cluster is created with the initdb/pg_ctl binaries found on PATH (or in PG_BIN) and removed afterwards.
+
+"""
+
+from contextlib import contextmanager, ExitStack
+import logging
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+from typing import Iterator, List
+
+import attr
+import psycopg2
+
+from benchmarks import dataset
+
+logger = logging.getLogger('benchmarks')
+
+TABLE = 'bench_users'
+
+
+@attr.s(slots=True, frozen=True)
+class PostgresSettings:
+    host = attr.ib()  # type: str
+    port = attr.ib()  # type: int
+    database = attr.ib()  # type: str
+    user = attr.ib()  # type: str
+    password = attr.ib(default='')  # type: str
+
+    def export(self):
+        """ Make the settings visible to api_utils.parse_authorization_details and libpq in this and child processes."""
+        os.environ['PG_HOST'] = self.host
+        os.environ['PG_DATABASE'] = self.database
+        os.environ['PGPORT'] = str(self.port)
+
+    def connect(self):
+        return psycopg2.connect(host=self.host, port=self.port, database=self.database, user=self.user,
+                                password=self.password)
+
+
+def _pg_binary(name: str) -> str:
+    pg_bin = os.getenv('PG_BIN')
+    path = os.path.join(pg_bin, name) if pg_bin else shutil.which(name)
+    if not path or not os.path.exists(path):
+        raise RuntimeError(f'Could not find {name}.  Install Postgres, set PG_BIN, or point PG_HOST at a running server.')
+    return path
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def temporary_cluster() -> Iterator[PostgresSettings]:
+    data_dir = tempfile.mkdtemp(prefix='apiutils-bench-pg-')
+    port = _free_port()
+    user = 'bench'
+    try:
+        subprocess.run([_pg_binary('initdb'), '-D', data_dir, '-U', user, '-A', 'trust'],
+                       check=True, stdout=subprocess.DEVNULL)
+        subprocess.run([_pg_binary('pg_ctl'), '-D', data_dir, '-w', '-l', os.path.join(data_dir, 'server.log'),
+                        '-o', f'-p {port} -k {data_dir} -c listen_addresses=127.0.0.1', 'start'],
+                       check=True, stdout=subprocess.DEVNULL)
+        try:
+            yield PostgresSettings(host='127.0.0.1', port=port, database='postgres', user=user)
+        finally:
+            subprocess.run([_pg_binary('pg_ctl'), '-D', data_dir, '-m', 'fast', 'stop'],
+                           check=True, stdout=subprocess.DEVNULL)
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+def create_views(settings: PostgresSettings, sizes: List[int]):
+    connection = settings.connect()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {TABLE} CASCADE;')
+            cursor.execute(f'CREATE TABLE {TABLE} (user_id integer PRIMARY KEY, user_name text, '
+                           f'registration_status text, access_level integer, access_id integer, created_at timestamp);')
+            cursor.execute(f"INSERT INTO {TABLE} SELECT i, 'user_' || i, %s, i %% 5, 1000 + i, %s "
+                           f"FROM generate_series(1, %s) AS i;",
+                           (dataset.REGISTRATION_STATUS, dataset.CREATED_AT, max(sizes)))
+            for size in sizes:
+                cursor.execute(f'CREATE VIEW {dataset.view_name(size)} AS '
+                               f'SELECT * FROM {TABLE} WHERE user_id <= {int(size)};')
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def drop_views(settings: PostgresSettings):
+    connection = settings.connect()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {TABLE} CASCADE;')
+        connection.commit()
+    finally:
+        connection.close()
+
+
+@contextmanager
+def local_postgres(sizes: List[int]) -> Iterator[PostgresSettings]:
+    """ Yield settings for a Postgres server holding one benchmark view per result size."""
+    with ExitStack() as stack:
+        if os.getenv('PG_HOST'):
+            settings = PostgresSettings(host=os.environ['PG_HOST'],
+                                        port=int(os.getenv('PGPORT', '5432')),
+                                        database=os.getenv('PG_DATABASE', 'test_database'),
+                                        user=os.getenv('BENCH_PG_USER', 'postgres'),
+                                        password=os.getenv('BENCH_PG_PASSWORD', ''))
+        else:
+            settings = stack.enter_context(temporary_cluster())
+
+        logger.info(f'Creating benchmark views in {settings.database} at {settings.host}:{settings.port}')
+        create_views(settings, sizes)
+        stack.callback(drop_views, settings)
+        settings.export()
+        yield settings
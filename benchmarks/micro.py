@@ -0,0 +1,127 @@
+"""
+
+Project: ApiToolbox
+
+File Name: micro
+
+Author: agent, agent@local
+
+Creation Date: 10/19/26
+
+Version: 1.0
+
+Purpose: Single-threaded timings of the individual CPU-bound stages of the request pipeline, isolated from Flask
+         routing and the database.
+
+Special Notes:
+
+"""
+
+import logging
+import os
+import time
+from typing import Callable, Dict
+
+from flask import Flask
+
+from apiutils.api_utils import create_response, fail_gracefully, parse_post_data
+from apiutils.views.viewpresenter import ViewPresenter
+from benchmarks import dataset
+from benchmarks.app import BenchUsersSchema
+from benchmarks.fakedb import FakeDBConnect
+from benchmarks.loadgen import LoadResult
+
+QUERY_ARGS = {'registration_status': dataset.REGISTRATION_STATUS, 'access_level': '', 'user_name': 'user_1'}
+
+# Calls timed together per sample, so stages costing a few microseconds are not swamped by the timer itself
+BATCH_CALLS = 100
+
+
+def batch_size(size: int=None) -> int:
+    """ Calls per sample for a stage handling `size` rows, or a fixed-cost stage when `size` is None."""
+    return BATCH_CALLS if size is None else max(1, BATCH_CALLS // size)
+
+
+def time_calls(func: Callable[[], object], samples: int, batch: int=1, warmup: int=1) -> LoadResult:
+    """ Time `samples` batches of `batch` calls to `func`.  Latencies are the mean time per call within each batch."""
+    for _ in range(warmup):
+        func()
+
+    latencies = []
+    calls = range(batch)
+    started = time.perf_counter()
+    for _ in range(samples):
+        batch_started = time.perf_counter()
+        for _ in calls:
+            func()
+        latencies.append((time.perf_counter() - batch_started) / batch)
+    elapsed = time.perf_counter() - started
+
+    return LoadResult(requests=samples * batch, errors=0, elapsed=elapsed, latencies=latencies)
+
+
+def fail_gracefully_call() -> Callable[[], object]:
+    return fail_gracefully(lambda: None)
+
+
+def fail_gracefully_exception_call() -> Callable[[], object]:
+    """ Time the exception branch: logging the traceback and building the 500 response."""
+    app = Flask('apiutils-micro-benchmarks')
+
+    # The traceback is formatted and written as it would be in production, just not to the console
+    logger = logging.getLogger('benchmarks.micro.fail_gracefully')
+    logger.propagate = False
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler(open(os.devnull, 'w')))
+
+    @fail_gracefully
+    def raise_error(**kwargs):
+        raise ValueError('benchmark failure')
+
+    def call():
+        with app.app_context():
+            return raise_error(logger=logger)
+    return call
+
+
+def sql_generation_call() -> Callable[[], object]:
+    def generate():
+        ViewPresenter.validate_args(dataset.MATCHING_ARGS, QUERY_ARGS)
+        match_string, params = ViewPresenter.get_match_string(**QUERY_ARGS)
+        return ViewPresenter.generate_sql_string(f'SELECT * FROM {dataset.view_name(1)}', match_string), params
+    return generate
+
+
+def query_rows_call(size: int) -> Callable[[], object]:
+    connection = FakeDBConnect()
+    sql = f'SELECT * FROM {dataset.view_name(size)};'
+    return lambda: connection.query(sql, fetch=True)
+
+
+def create_response_call(size: int) -> Callable[[], object]:
+    app = Flask('apiutils-micro-benchmarks')
+    body = {'users': FakeDBConnect().query(f'SELECT * FROM {dataset.view_name(size)};', fetch=True)}
+
+    def respond():
+        with app.app_context():
+            return create_response(200, 'Success', body)
+    return respond
+
+
+def parse_post_data_call(size: int) -> Callable[[], object]:
+    users = [dict(zip(dataset.COLUMNS, values)) for values in dataset.make_rows(size)]
+    for user in users:
+        user['created_at'] = user['created_at'].isoformat()
+    payload = {'users': users}
+    return lambda: parse_post_data(BenchUsersSchema, payload)
+
+
+# Stages whose cost does not depend on the result size
+FIXED_STAGES: Dict[str, Callable[[], Callable]] = {'fail_gracefully': fail_gracefully_call,
+                                                   'fail_gracefully_exception': fail_gracefully_exception_call,
+                                                   'sql_generation': sql_generation_call}
+
+# Stages timed once per result size
+SIZED_STAGES: Dict[str, Callable[[int], Callable]] = {'query_rows': query_rows_call,
+                                                      'create_response': create_response_call,
+                                                      'parse_post_data': parse_post_data_call}
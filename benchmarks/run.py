@@ -0,0 +1,191 @@
+"""
+
+Project: ApiToolbox
+
+File Name: run
+
+Author: agent, agent@local
+
+Creation Date: 10/19/26
+
+Version: 1.0
+
+Purpose: Command line entry point for the benchmark suite.
+
+Special Notes: Each scenario runs in its own freshly spawned process so its peak RSS is not inflated by the scenarios
+               that ran before it.
+
+    python -m benchmarks.run                                  # fake psycopg2 connection, moto CloudWatch
+    python -m benchmarks.run --backend postgres               # throwaway local Postgres (or PG_HOST)
+    python -m benchmarks.run --save-baseline                  # record benchmarks/baselines/<backend>.json
+    python -m benchmarks.run --compare                        # exit 1 if any metric regressed past --tolerance
+
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+import json
+import logging
+import multiprocessing
+import os
+import statistics
+import sys
+from typing import List
+
+from benchmarks import baselines, dataset
+from benchmarks.scenarios import BACKENDS, Scenario, build_scenarios, run_scenario
+
+logger = logging.getLogger('benchmarks')
+
+COLUMNS = (('key', 'scenario', 34), ('threads', 'threads', 7), ('requests', 'requests', 8),
+           ('errors', 'errors', 6), ('requests_per_second', 'req/s', 11), ('p50_us', 'p50 us', 12),
+           ('p99_us', 'p99 us', 12), ('peak_rss_kb', 'peak RSS KiB', 12))
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'{value} is not a positive integer')
+    return number
+
+
+def parse_args(argv: List[str]=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description='Benchmark the BaseApi / BaseViewApi request pipeline.')
+    parser.add_argument('--backend', choices=BACKENDS, default='fake',
+                        help='database behind the load scenarios (default: fake)')
+    parser.add_argument('--suite', choices=('load', 'micro', 'all'), default='all')
+    parser.add_argument('--sizes', type=positive_int, nargs='+', default=list(dataset.DEFAULT_SIZES),
+                        help='result sizes in rows (default: 1 1000 100000)')
+    parser.add_argument('--threads', type=positive_int, default=4, help='load generator threads (default: 4)')
+    parser.add_argument('--requests', type=positive_int, default=None,
+                        help='requests / iterations per scenario (default: scaled down as the result size grows)')
+    parser.add_argument('--no-cloudwatch', dest='cloudwatch', action='store_false',
+                        help='do not attach moto-backed CloudWatch handlers to the pipeline loggers')
+    parser.add_argument('--in-process', action='store_true',
+                        help='run every scenario in this process; faster, but peak RSS becomes cumulative')
+    parser.add_argument('--output', help='also write the results as JSON to this path')
+    parser.add_argument('--save-baseline', nargs='?', const='', default=None, metavar='PATH',
+                        help='save the results as a baseline (default path: benchmarks/baselines/<backend>.json)')
+    parser.add_argument('--compare', nargs='?', const='', default=None, metavar='PATH',
+                        help='compare against a baseline and exit 1 on regression (default path as above)')
+    parser.add_argument('--repeat', type=positive_int, default=3,
+                        help='run each scenario this many times and report the median of each metric (default: 3)')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='fractional change in a metric tolerated before it counts as a regression (default: 0.25)')
+    parser.add_argument('--p99-tolerance', type=float, default=1.0,
+                        help='fractional change tolerated in p99 latency, which is checked only for scenarios with at '
+                             f'least {baselines.MIN_P99_SAMPLES} latency samples (default: 1.0)')
+    return parser.parse_args(argv)
+
+
+def median_result(runs: List[dict]) -> dict:
+    """ Combine repeated runs of one scenario, taking the median of each metric and the total of the errors."""
+    result = dict(runs[0])
+    for metric in baselines.METRICS:
+        result[metric] = statistics.median(run[metric] for run in runs)
+    result['requests'] = min(run['requests'] for run in runs)
+    result['samples'] = min(run['samples'] for run in runs)
+    result['errors'] = sum(run['errors'] for run in runs)
+    result['runs'] = len(runs)
+    return result
+
+
+def run_scenarios(scenarios: List[Scenario], in_process: bool=False, repeat: int=1) -> List[dict]:
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for scenario in scenarios:
+        runs = []
+        for attempt in range(repeat):
+            logger.info(f'Running {scenario.key} ({scenario.requests} requests, run {attempt + 1} of {repeat})')
+            if in_process:
+                runs.append(run_scenario(scenario))
+            else:
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    runs.append(executor.submit(run_scenario, scenario).result())
+        result = median_result(runs)
+        print(format_row(result), flush=True)
+        results.append(result)
+    return results
+
+
+def format_header() -> str:
+    return '  '.join(title.rjust(width) if i else title.ljust(width) for i, (_, title, width) in enumerate(COLUMNS))
+
+
+def format_row(result: dict) -> str:
+    return '  '.join(str(result[key]).rjust(width) if i else str(result[key]).ljust(width)
+                     for i, (key, _, width) in enumerate(COLUMNS))
+
+
+def main(argv: List[str]=None) -> int:
+    args = parse_args(argv)
+    # Progress goes to stderr; the pipeline loggers are left alone so their cost is whatever the scenario configures
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler(sys.stderr))
+
+    suites = ['load', 'micro'] if args.suite == 'all' else [args.suite]
+    settings = {'backend': args.backend, 'suites': suites, 'sizes': args.sizes, 'threads': args.threads,
+                'requests': args.requests, 'cloudwatch': args.cloudwatch, 'repeat': args.repeat}
+
+    # Fail before spending minutes on the scenarios rather than after
+    if args.compare is not None:
+        compare_path = args.compare or baselines.default_path(args.backend)
+        if not os.path.exists(compare_path):
+            print(f'No baseline at {compare_path}; record one with --save-baseline')
+            return 1
+
+    with ExitStack() as stack:
+        pg_user, pg_password = '', ''
+        if args.backend == 'postgres' and 'load' in suites:
+            from benchmarks.localpg import local_postgres
+            pg_settings = stack.enter_context(local_postgres(args.sizes))
+            pg_user, pg_password = pg_settings.user, pg_settings.password
+
+        scenarios = build_scenarios(suites, args.sizes, args.threads, args.backend, args.cloudwatch,
+                                    requests=args.requests, pg_user=pg_user, pg_password=pg_password)
+        print(format_header(), flush=True)
+        results = run_scenarios(scenarios, in_process=args.in_process, repeat=args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump({'machine': baselines.machine(), 'settings': settings, 'results': results}, output, indent=2)
+
+    failures = [result for result in results if result['errors']]
+    if failures:
+        print(f'{len(failures)} scenario(s) had failed requests; not saving or comparing a baseline:')
+        for result in failures:
+            print(f"  {result['key']}: {result['errors']} error(s), {result['requests']} successful request(s)")
+        return 1
+
+    if args.save_baseline is not None:
+        path = args.save_baseline or baselines.default_path(args.backend)
+        baselines.save(results, path, settings)
+        print(f'Saved baseline to {path}')
+
+    if args.compare is not None:
+        path = compare_path
+        baseline = baselines.load(path)
+        if baseline['machine'] != baselines.machine():
+            print(f"Baseline {path} was recorded on a different machine: {baseline['machine']}")
+        mismatches = baselines.settings_mismatches(baseline, settings)
+        if mismatches:
+            print(f'Baseline {path} was recorded with different settings; not comparing:')
+            for mismatch in mismatches:
+                print(f'  {mismatch}')
+            return 1
+        regressions = baselines.compare(results, baseline, args.tolerance, p99_tolerance=args.p99_tolerance)
+        if regressions:
+            print(f'{len(regressions)} regression(s) against {path}:')
+            for regression in regressions:
+                print(f'  {regression}')
+            return 1
+        print(f'No regressions against {path} (tolerance {args.tolerance:.0%}, p99 {args.p99_tolerance:.0%})')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+
+Project: ApiToolbox
+
+File Name: scenarios
+
+Author: agent, agent@local
+
+Creation Date: 10/19/26
+
+Version: 1.0
+
+Purpose: Definitions of the load and micro benchmark scenarios and the code which runs a single one of them.
+
+Special Notes: run_scenario is the entry point for the worker process spawned per scenario, so it must remain a
+               picklable module-level function.
+
+"""
+
+from contextlib import ExitStack
+import json
+import logging
+import sys
+from typing import List
+
+import attr
+
+from apiutils.dbconnect import BaseDBConnect
+from benchmarks import dataset, micro
+from benchmarks.app import create_app
+from benchmarks.fakedb import FakeDBConnect
+from benchmarks.loadgen import RequestSpec, basic_auth_header, peak_rss_kb, run_load
+
+LOAD_SCENARIOS = ('base_get', 'base_post', 'view_get')
+
+BACKENDS = ('fake', 'postgres')
+
+# Rows to push through each scenario, which keeps the 100k row runs to a handful of requests
+ROW_BUDGET = 200000
+MIN_REQUESTS = 5
+MAX_REQUESTS = 2000
+
+PIPELINE_LOGGERS = ('api_logger', 'BaseViewApi', 'db_logger')
+
+
+@attr.s(slots=True, frozen=True)
+class Scenario:
+    suite = attr.ib()  # type: str
+    name = attr.ib()  # type: str
+    size = attr.ib()  # type: int
+    requests = attr.ib()  # type: int
+    threads = attr.ib(default=1)  # type: int
+    backend = attr.ib(default='fake')  # type: str
+    cloudwatch = attr.ib(default=True)  # type: bool
+    pg_user = attr.ib(default='')  # type: str
+    pg_password = attr.ib(default='')  # type: str
+
+    @property
+    def key(self) -> str:
+        size = self.size if self.size is not None else '-'
+        return f'{self.suite}/{self.name}/{size}'
+
+
+def default_requests(size: int) -> int:
+    return max(MIN_REQUESTS, min(MAX_REQUESTS, ROW_BUDGET // max(size or 1, 1)))
+
+
+def build_scenarios(suites: List[str], sizes: List[int], threads: int, backend: str, cloudwatch: bool,
+                    requests: int=None, pg_user: str='', pg_password: str='') -> List[Scenario]:
+    scenarios = []
+    if 'load' in suites:
+        for name in LOAD_SCENARIOS:
+            for size in sizes:
+                scenarios.append(Scenario(suite='load', name=name, size=size,
+                                          requests=requests or default_requests(size), threads=threads,
+                                          backend=backend, cloudwatch=cloudwatch, pg_user=pg_user,
+                                          pg_password=pg_password))
+    if 'micro' in suites:
+        for name in micro.FIXED_STAGES:
+            scenarios.append(Scenario(suite='micro', name=name, size=None, requests=requests or MAX_REQUESTS))
+        for name in micro.SIZED_STAGES:
+            for size in sizes:
+                scenarios.append(Scenario(suite='micro', name=name, size=size,
+                                          requests=requests or default_requests(size)))
+    return scenarios
+
+
+def request_spec(scenario: Scenario) -> RequestSpec:
+    auth = basic_auth_header(scenario.pg_user or 'bench', scenario.pg_password)
+    if scenario.name == 'base_get':
+        return RequestSpec(method='GET', path='/users', query_string={'size': scenario.size}, headers=auth)
+    if scenario.name == 'base_post':
+        users = [dict(zip(dataset.COLUMNS, values)) for values in dataset.make_rows(scenario.size)]
+        for user in users:
+            user['created_at'] = user['created_at'].isoformat()
+        return RequestSpec(method='POST', path='/users', data=json.dumps({'users': users}).encode(),
+                           headers={'Content-Type': 'application/json'})
+    if scenario.name == 'view_get':
+        return RequestSpec(method='GET', path=f'/view/{scenario.size}',
+                           query_string={'registration_status': dataset.REGISTRATION_STATUS}, headers=auth)
+    raise ValueError(f'Unknown load scenario {scenario.name}')
+
+
+def _run_load_scenario(scenario: Scenario):
+    if scenario.backend == 'fake':
+        FakeDBConnect.load([scenario.size])
+        connection_type = FakeDBConnect
+    else:
+        connection_type = BaseDBConnect
+
+    app = create_app(connection_type, [scenario.size])
+    spec = request_spec(scenario)
+    reported = []
+
+    def report_error(response):
+        # One example is enough to diagnose a misconfigured run without flooding the output
+        if not reported:
+            reported.append(response)
+            print(f'{scenario.key}: unexpected {response.status_code} response: {response.get_data(as_text=True)[:500]}',
+                  file=sys.stderr)
+
+    with ExitStack() as stack:
+        if scenario.cloudwatch:
+            from benchmarks.cloudwatch import mocked_cloudwatch
+            stack.enter_context(mocked_cloudwatch([logging.getLogger(name) for name in PIPELINE_LOGGERS]))
+        return run_load(app, spec, requests=scenario.requests, threads=scenario.threads, on_error=report_error)
+
+
+def _run_micro_scenario(scenario: Scenario):
+    if scenario.name in micro.FIXED_STAGES:
+        call = micro.FIXED_STAGES[scenario.name]()
+    else:
+        FakeDBConnect.load([scenario.size])
+        call = micro.SIZED_STAGES[scenario.name](scenario.size)
+    return micro.time_calls(call, scenario.requests, batch=micro.batch_size(scenario.size))
+
+
+def run_scenario(scenario: Scenario) -> dict:
+    """ Run one scenario and summarise it as a JSON-serializable dict."""
+    if scenario.suite == 'load':
+        result = _run_load_scenario(scenario)
+    else:
+        result = _run_micro_scenario(scenario)
+
+    return {'key': scenario.key,
+            'suite': scenario.suite,
+            'name': scenario.name,
+            'size': scenario.size,
+            'threads': scenario.threads,
+            'requests': result.requests,
+            'samples': len(result.latencies),
+            'errors': result.errors,
+            'requests_per_second': round(result.requests_per_second, 2),
+            'p50_us': round(result.percentile(50) * 1e6, 3),
+            'p99_us': round(result.percentile(99) * 1e6, 3),
+            'peak_rss_kb': peak_rss_kb()}
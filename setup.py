@@ -28,7 +28,7 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type='text/markdown',
     url='https://github.com/zyd14/restapitoolbox',
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=['benchmarks', 'benchmarks.*', 'tests', 'tests.*']),
     install_requires=["aws_xray_sdk==2.4.0",
                         "boto3==1.9.93",
                         "Flask==1.0.2",
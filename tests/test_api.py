@@ -0,0 +1,148 @@
+"""
+
+Project: ApiToolbox
+
+File Name: test_api
+
+Author: agent, agent@local
+
+Creation Date: 10/19/26
+
+Version: 1.0
+
+Purpose: Tests for the BaseApi / BaseViewApi request pipeline and the database connection it builds.
+
+Special Notes: Database access goes through a fake connection or a patched psycopg2.connect, so no Postgres server is
+               needed.
+
+"""
+
+import base64
+from types import SimpleNamespace
+from unittest import mock
+
+from flask import Flask
+from flask_restful import Api
+import pytest
+
+from apiutils.api_utils import parse_authorization_details
+from apiutils.baseapi import BaseApi
+from apiutils.dbconnect import BaseDBConnect
+from apiutils.views.viewapi import BaseViewApi
+
+AUTH = {'Authorization': 'Basic ' + base64.b64encode(b'ted:secret').decode()}
+
+ROWS = [{'user_id': 1, 'user_name': 'ted', 'registration_status': 'registered'},
+        {'user_id': 2, 'user_name': 'alice', 'registration_status': 'registered'}]
+
+
+class FakeCursor:
+
+    def __init__(self, executed: list):
+        self.executed = executed
+
+    def execute(self, sql: str, params: tuple=None):
+        self.executed.append((sql, params))
+
+    def fetchall(self) -> list:
+        return ROWS
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+
+    def __init__(self):
+        self.executed = []
+
+    def cursor(self, cursor_factory=None) -> FakeCursor:
+        return FakeCursor(self.executed)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class FakeDBConnect(BaseDBConnect):
+
+    connections = []
+
+    def _connect(self) -> FakeConnection:
+        connection = FakeConnection()
+        self.connections.append(connection)
+        return connection
+
+
+class UsersViewApi(BaseViewApi):
+
+    connection_type = FakeDBConnect
+
+    @classmethod
+    def get_view_config(cls, config_path: str=''):
+        return {'endpoint': {'url': '/users/view',
+                             'matching_args': ['user_id', 'user_name', 'registration_status'],
+                             'view': 'v_users'}}
+
+
+class EchoApi(BaseApi):
+
+    def perform_get_request(self, raw_request, *args, **kwargs) -> dict:
+        return {'method': 'GET'}
+
+    def perform_post_request(self, raw_request) -> dict:
+        return {'method': 'POST'}
+
+
+@pytest.fixture
+def client():
+    FakeDBConnect.connections = []
+    app = Flask('test_api')
+    api = Api(app)
+    api.add_resource(UsersViewApi, '/users/view')
+    api.add_resource(EchoApi, '/echo')
+    return app.test_client()
+
+
+def test_view_get_returns_rows(client):
+    response = client.get('/users/view', query_string={'registration_status': 'registered'}, headers=AUTH)
+
+    assert response.status_code == 200
+    assert response.get_json()['body'] == ROWS
+    [connection] = FakeDBConnect.connections
+    assert connection.executed == [('SELECT * FROM v_users WHERE registration_status=%s;', ('registered',))]
+
+
+def test_view_get_rejects_unexpected_query_args(client):
+    response = client.get('/users/view', query_string={'favourite_colour': 'blue'}, headers=AUTH)
+
+    assert response.status_code == 400
+    assert 'favourite_colour=blue' in response.get_json()['message']
+
+
+@pytest.mark.parametrize('method', ['GET', 'POST'])
+def test_base_api_logs_request(client, method):
+    logged = []
+
+    def record(logger, request):
+        logged.append((logger, request.method, request.path))
+
+    with mock.patch.object(EchoApi, 'log_request', side_effect=record):
+        response = client.open('/echo', method=method)
+
+    assert response.status_code == 200
+    assert response.get_json()['body'] == {'method': method}
+    assert logged == [(EchoApi.logger, method, '/echo')]
+
+
+def test_authorization_details_open_a_connection():
+    details = parse_authorization_details(SimpleNamespace(username='ted', password='secret'))
+
+    with mock.patch('apiutils.dbconnect.psycopg2.connect') as connect:
+        connection = BaseDBConnect(**details)
+
+    connect.assert_called_once_with(user='ted', password='secret', host=details['host'],
+                                    database=details['database'], connect_timeout=60)
+    assert connection.connection is connect.return_value
@@ -0,0 +1,142 @@
+"""
+
+Project: ApiToolbox
+
+File Name: test_benchmarks
+
+Author: agent, agent@local
+
+Creation Date: 10/19/26
+
+Version: 1.0
+
+Purpose: Tests for the statistics and baseline comparison used by the benchmark suite.
+
+Special Notes:
+
+"""
+
+import logging
+import os
+
+import boto3
+import watchtower
+
+from benchmarks import baselines, run
+from benchmarks.cloudwatch import LOG_GROUP, LOG_STREAM, mocked_cloudwatch
+from benchmarks.loadgen import LoadResult
+from benchmarks.scenarios import Scenario, run_scenario
+
+
+def load_result(latencies):
+    return LoadResult(requests=len(latencies), errors=0, elapsed=1.0, latencies=latencies)
+
+
+def result(key='load/base_get/1', requests=1000, samples=1000, errors=0, requests_per_second=100.0, p50_us=10.0,
+           p99_us=20.0, peak_rss_kb=1000):
+    return {'key': key, 'requests': requests, 'samples': samples, 'errors': errors,
+            'requests_per_second': requests_per_second, 'p50_us': p50_us, 'p99_us': p99_us, 'peak_rss_kb': peak_rss_kb}
+
+
+def baseline(*results, **settings):
+    return {'machine': baselines.machine(), 'settings': settings, 'results': list(results)}
+
+
+def test_percentile_uses_nearest_rank():
+    run = load_result([i / 1000 for i in range(100, 0, -1)])
+
+    assert run.percentile(50) == 0.05
+    assert run.percentile(99) == 0.099
+    assert run.percentile(100) == 0.1
+    assert run.percentile(0) == 0.001
+
+
+def test_percentile_of_single_and_empty_runs():
+    assert load_result([0.25]).percentile(99) == 0.25
+    assert load_result([]).percentile(50) == 0.0
+
+
+def test_compare_within_tolerance():
+    regressions = baselines.compare([result(requests_per_second=80.0, p50_us=12.0)], baseline(result()), 0.25)
+
+    assert regressions == []
+
+
+def test_compare_flags_each_worse_metric():
+    current = result(requests_per_second=50.0, p50_us=20.0, peak_rss_kb=2000, errors=1)
+
+    regressions = baselines.compare([current], baseline(result()), 0.25)
+
+    assert len(regressions) == 4
+    assert regressions[0] == 'load/base_get/1: errors 0 -> 1'
+    assert any(regression.startswith('load/base_get/1: requests_per_second 100.0 -> 50.0') for regression in regressions)
+
+
+def test_compare_ignores_improvements_and_unknown_scenarios():
+    current = [result(requests_per_second=500.0, p50_us=1.0), result(key='load/base_get/1000', p50_us=1e6)]
+
+    assert baselines.compare(current, baseline(result()), 0.25) == []
+
+
+def test_compare_p99_uses_its_own_tolerance():
+    current = [result(p99_us=35.0)]
+
+    assert baselines.compare(current, baseline(result()), 0.25, p99_tolerance=1.0) == []
+    assert baselines.compare(current, baseline(result()), 0.25, p99_tolerance=0.5) == \
+        ['load/base_get/1: p99_us 20.0 -> 35.0 (+75.0%)']
+
+
+def test_compare_skips_p99_with_too_few_samples():
+    # A micro stage timing 5 batches of 100 calls has 500 requests but only 5 latency samples
+    current = [result(requests=500, samples=5, p99_us=100.0)]
+
+    assert baselines.compare(current, baseline(result(requests=500, samples=5)), 0.25) == []
+
+
+def test_compare_checks_metrics_with_zero_baseline():
+    regressions = baselines.compare([result(p50_us=1.0)], baseline(result(p50_us=0.0)), 0.25)
+
+    assert regressions == ['load/base_get/1: p50_us 0.0 -> 1.0 (+inf%)']
+
+
+def test_settings_mismatches():
+    recorded = baseline(backend='fake', threads=4, requests=None, cloudwatch=True, repeat=3)
+
+    assert baselines.settings_mismatches(recorded, {'backend': 'fake', 'threads': 4, 'requests': None,
+                                                    'cloudwatch': True, 'repeat': 1}) == []
+    assert baselines.settings_mismatches(recorded, {'backend': 'fake', 'threads': 8, 'requests': None,
+                                                    'cloudwatch': True}) == ['threads: baseline 4, this run 8']
+
+
+def test_mocked_cloudwatch_delivers_records_and_cleans_up():
+    logger = logging.getLogger('tests.cloudwatch')
+    execution_env = os.environ.get('AWS_EXECUTION_ENV')
+
+    with mocked_cloudwatch([logger]):
+        [handler] = [h for h in logger.handlers if isinstance(h, watchtower.CloudWatchLogHandler)]
+        logger.info('hello from the benchmarks')
+        handler.flush()
+        events = boto3.client('logs', region_name='us-west-2').get_log_events(logGroupName=LOG_GROUP,
+                                                                             logStreamName=LOG_STREAM)['events']
+
+    assert any('hello from the benchmarks' in event['message'] for event in events)
+    assert logger.handlers == []
+    assert os.environ.get('AWS_EXECUTION_ENV') == execution_env
+
+
+def test_run_scenario_with_cloudwatch():
+    result = run_scenario(Scenario(suite='load', name='view_get', size=1, requests=3, threads=2, cloudwatch=True))
+
+    assert result['errors'] == 0
+    assert result['requests'] == result['samples'] == 3
+    assert result['p99_us'] >= result['p50_us'] > 0
+
+
+def test_run_main_in_process(capsys):
+    status = run.main(['--sizes', '1', '--requests', '2', '--repeat', '1', '--in-process', '--no-cloudwatch'])
+
+    output = capsys.readouterr().out
+    assert status == 0
+    for key in ('load/base_get/1', 'load/base_post/1', 'load/view_get/1', 'micro/fail_gracefully_exception/-',
+                'micro/parse_post_data/1'):
+        assert key in output